@@ -4,6 +4,7 @@ from django.core.exceptions import ValidationError
 from ...core.permissions import AppPermission, AuthorizationFilters
 from ...webhook import models
 from ...webhook.error_codes import WebhookErrorCode
+from ...webhook.utils import invalidate_webhooks_for_event_cache
 from ..core.descriptions import ADDED_IN_32, DEPRECATED_IN_3X_INPUT, PREVIEW_FEATURE
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ..core.types import NonNullList, WebhookError
@@ -137,6 +138,7 @@ class WebhookCreate(ModelMutation):
                 for event in events
             ]
         )
+        invalidate_webhooks_for_event_cache()
 
 
 class WebhookUpdateInput(graphene.InputObjectType):
@@ -233,6 +235,7 @@ class WebhookUpdate(ModelMutation):
                     for event in events
                 ]
             )
+            invalidate_webhooks_for_event_cache()
 
 
 class WebhookDelete(ModelDeleteMutation):
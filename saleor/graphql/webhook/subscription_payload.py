@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from celery.utils.log import get_task_logger
@@ -65,6 +66,19 @@ def initialize_context(requestor=None) -> HttpRequest:
     return context
 
 
+@lru_cache(maxsize=1024)
+def get_subscription_document(subscription_query: str) -> GraphQLDocument:
+    """Return a document for the subscription query.
+
+    Documents are cached, so a query shared by many webhooks is parsed only once.
+    """
+    from ..api import schema
+
+    graphql_backend = get_default_backend()
+    ast = parse(subscription_query)
+    return graphql_backend.document_from_string(schema, ast)
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
@@ -88,15 +102,9 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)  # type: ignore
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)  # type: ignore
     app_id = app.pk if app else None
 
     context.app = app  # type: ignore
@@ -1,36 +1,52 @@
 import json
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 from urllib.parse import urlparse, urlunparse
 
 import boto3
 import requests
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import group
 from celery.exceptions import MaxRetriesExceededError
 from celery.utils.log import get_task_logger
+from google.api_core.exceptions import GoogleAPIError
 from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
 from ...core import EventDeliveryStatus
-from ...core.models import EventDelivery, EventPayload
+from ...core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ...core.tracing import webhooks_opentracing_trace
 from ...graphql.webhook.subscription_payload import (
     generate_payload_from_subscription,
     initialize_context,
 )
 from ...payment import PaymentError
-from ...settings import WEBHOOK_SYNC_TIMEOUT, WEBHOOK_TIMEOUT
+from ...settings import (
+    WEBHOOK_BATCH_MAX_WORKERS,
+    WEBHOOK_BATCH_SIZE,
+    WEBHOOK_BULK_CREATE_BATCH_SIZE,
+    WEBHOOK_SYNC_TIMEOUT,
+    WEBHOOK_TIMEOUT,
+)
 from ...site.models import Site
 from ...webhook.event_types import SUBSCRIBABLE_EVENTS
-from ...webhook.utils import get_webhooks_for_event
+from ...webhook.utils import get_cached_webhooks_for_event
 from . import signature_for_payload
 from .utils import (
     attempt_update,
+    build_attempt,
     catch_duration_time,
+    clear_successful_deliveries,
     clear_successful_delivery,
     create_attempt,
     create_event_delivery_list_for_webhooks,
@@ -43,6 +59,48 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+# Limits of a single SQS `send_message_batch` request.
+SQS_MAX_BATCH_ENTRIES = 10
+SQS_MAX_BATCH_SIZE = 256 * 1024
+
+# Client-side batching of messages published to Google Cloud Pub/Sub.
+PUBSUB_MAX_BATCH_MESSAGES = 100
+PUBSUB_MAX_BATCH_SIZE = 1000 * 1000
+PUBSUB_MAX_BATCH_LATENCY = 0.01
+PUBSUB_EXCEPTIONS = (
+    pubsub_v1.publisher.exceptions.MessageTooLargeError,
+    GoogleAPIError,
+    RuntimeError,
+    TimeoutError,
+    # not a subclass of the builtin TimeoutError before Python 3.11
+    FutureTimeoutError,
+)
+
+# Only the beginning of a response body is kept for async delivery attempts.
+HTTP_MAX_RESPONSE_CONTENT_SIZE = 64 * 1024
+HTTP_RESPONSE_CHUNK_SIZE = 8 * 1024
+
+# Values of the event, domain and signature headers are set for every request.
+HTTP_HEADERS_TEMPLATE = {
+    "Content-Type": "application/json",
+    # X- headers will be deprecated in Saleor 4.0, proper headers are without X-
+    "X-Saleor-Event": "",
+    "X-Saleor-Domain": "",
+    "X-Saleor-Signature": "",
+    "Saleor-Event": "",
+    "Saleor-Domain": "",
+    "Saleor-Signature": "",
+}
+
+# Shared across requests to keep connections to webhook targets alive, so that
+# TCP and TLS handshakes are not repeated for every delivery. Cookies are neither
+# stored nor sent, so they can't leak between apps sharing the session.
+http_session = requests.Session()
+http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+http_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=256, max_retries=0)
+http_session.mount("http://", http_adapter)
+http_session.mount("https://", http_adapter)
+
 
 class WebhookSchemes(str, Enum):
     HTTP = "http"
@@ -82,35 +140,51 @@ def create_deliveries_for_subscriptions(
 
     context = initialize_context(requestor)
 
-    event_payloads = []
+    # Webhooks of the same app sharing a subscription query get the same payload,
+    # so it's generated and stored only once.
+    payloads: Dict[Tuple[str, int], Optional[EventPayload]] = {}
     event_deliveries = []
+    delivery_payloads = []
     for webhook in webhooks:
-        data = generate_payload_from_subscription(
-            event_type=event_type,
-            subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
-            context=context,
-            app=webhook.app,
-        )
-        if not data:
+        payload_key = (webhook.subscription_query, webhook.app_id)
+        if payload_key not in payloads:
+            data = generate_payload_from_subscription(
+                event_type=event_type,
+                subscribable_object=subscribable_object,
+                subscription_query=webhook.subscription_query,
+                context=context,
+                app=webhook.app,
+            )
+            payloads[payload_key] = (
+                EventPayload(payload=json.dumps(data)) if data else None
+            )
+        event_payload = payloads[payload_key]
+        if not event_payload:
             logger.warning(
                 "No payload was generated with subscription for event: %s" % event_type
             )
             continue
 
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
+        delivery_payloads.append(event_payload)
         event_deliveries.append(
             EventDelivery(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
-                payload=event_payload,
                 webhook=webhook,
             )
         )
 
-    EventPayload.objects.bulk_create(event_payloads)
-    return EventDelivery.objects.bulk_create(event_deliveries)
+    # Primary keys are set on payloads by the bulk insert, so they can be bound to
+    # deliveries before these are inserted.
+    EventPayload.objects.bulk_create(
+        [payload for payload in payloads.values() if payload],
+        batch_size=WEBHOOK_BULK_CREATE_BATCH_SIZE,
+    )
+    for event_delivery, event_payload in zip(event_deliveries, delivery_payloads):
+        event_delivery.payload_id = event_payload.pk
+    return EventDelivery.objects.bulk_create(
+        event_deliveries, batch_size=WEBHOOK_BULK_CREATE_BATCH_SIZE
+    )
 
 
 def trigger_webhooks_async(
@@ -125,13 +199,18 @@ def trigger_webhooks_async(
     :param requestor: used in subscription webhooks to generate meta data for payload.
     """
     regular_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
+    if event_type not in SUBSCRIBABLE_EVENTS:
+        # subscription queries can't be resolved for these events, so subscription
+        # webhooks get the given data like the regular ones
+        regular_webhooks += subscription_webhooks
+        subscription_webhooks = []
     deliveries = []
 
     if regular_webhooks:
         payload = EventPayload.objects.create(payload=data)
         deliveries.extend(
             create_event_delivery_list_for_webhooks(
-                webhooks=webhooks,
+                webhooks=regular_webhooks,
                 event_payload=payload,
                 event_type=event_type,
             )
@@ -146,13 +225,49 @@ def trigger_webhooks_async(
             )
         )
 
+    if deliveries:
+        group(get_delivery_task_signatures(deliveries)).apply_async()
+
+
+def get_delivery_task_signatures(deliveries):
+    """Return signatures of the tasks sending given deliveries.
+
+    Deliveries targeting the same AWS SQS queue or Google Cloud Pub/Sub topic are
+    sent by the scheme specific batch tasks, the other ones are sent concurrently
+    by `send_webhook_batch_async`. Every batch task gets at most
+    `WEBHOOK_BATCH_SIZE` deliveries; a single delivery is sent by a separate task.
+    """
+    batch_tasks = {
+        WebhookSchemes.AWS_SQS: send_webhook_sqs_batch_async,
+        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: send_webhook_pubsub_batch_async,
+    }
+    batched_delivery_ids = defaultdict(list)
     for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+        target_url = delivery.webhook.target_url
+        scheme = urlparse(target_url).scheme.lower()
+        if scheme in batch_tasks:
+            batched_delivery_ids[(batch_tasks[scheme], target_url)].append(delivery.id)
+        else:
+            batched_delivery_ids[(send_webhook_batch_async, None)].append(delivery.id)
+
+    signatures = []
+    for (batch_task, _), delivery_ids in batched_delivery_ids.items():
+        for index in range(0, len(delivery_ids), WEBHOOK_BATCH_SIZE):
+            chunk = delivery_ids[index : index + WEBHOOK_BATCH_SIZE]  # noqa: E203
+            if len(chunk) > 1:
+                signatures.append(batch_task.s(chunk))
+            else:
+                signatures.append(send_webhook_request_async.s(chunk[0]))
+    return signatures
 
 
 def group_webhooks_by_subscription(webhooks):
-    subscription = [webhook for webhook in webhooks if webhook.subscription_query]
-    regular = [webhook for webhook in webhooks if not webhook.subscription_query]
+    regular, subscription = [], []
+    for webhook in webhooks:
+        if webhook.subscription_query:
+            subscription.append(webhook)
+        else:
+            regular.append(webhook)
 
     return regular, subscription
 
@@ -161,8 +276,8 @@ def trigger_webhook_sync(
     event_type: str, data: str, app: "App", timeout=None
 ) -> Optional[Dict[Any, Any]]:
     """Send a synchronous webhook request."""
-    webhooks = get_webhooks_for_event(event_type, app.webhooks.all())
-    webhook = webhooks.first()
+    webhooks = get_cached_webhooks_for_event(event_type, app)
+    webhook = webhooks[0] if webhooks else None
     if not webhook:
         raise PaymentError(f"No payment webhook found for event: {event_type}.")
     event_payload = EventPayload.objects.create(payload=data)
@@ -178,8 +293,29 @@ def trigger_webhook_sync(
     return send_webhook_request_sync(app.name, delivery, **kwargs)
 
 
+def read_response_content(response, max_size):
+    """Read at most `max_size` bytes of the response body and release it."""
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=HTTP_RESPONSE_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_size:
+                break
+    finally:
+        response.close()
+    return b"".join(chunks)[:max_size].decode("utf-8", "replace")
+
+
 def send_webhook_using_http(
-    target_url, message, domain, signature, event_type, timeout=WEBHOOK_TIMEOUT
+    target_url,
+    message,
+    domain,
+    signature,
+    event_type,
+    timeout=WEBHOOK_TIMEOUT,
+    max_content_size=HTTP_MAX_RESPONSE_CONTENT_SIZE,
 ):
     """Send a webhook request using http / https protocol.
 
@@ -189,23 +325,28 @@ def send_webhook_using_http(
     :param signature: Webhook secret key checksum.
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
+    :param max_content_size: Maximum number of response bytes to read, the whole
+        response is read when `None`.
 
     :return: WebhookResponse object.
     """
-    headers = {
-        "Content-Type": "application/json",
-        # X- headers will be deprecated in Saleor 4.0, proper headers are without X-
-        "X-Saleor-Event": event_type,
-        "X-Saleor-Domain": domain,
-        "X-Saleor-Signature": signature,
-        "Saleor-Event": event_type,
-        "Saleor-Domain": domain,
-        "Saleor-Signature": signature,
-    }
+    headers = HTTP_HEADERS_TEMPLATE.copy()
+    headers["X-Saleor-Event"] = headers["Saleor-Event"] = event_type
+    headers["X-Saleor-Domain"] = headers["Saleor-Domain"] = domain
+    headers["X-Saleor-Signature"] = headers["Saleor-Signature"] = signature
 
-    response = requests.post(target_url, data=message, headers=headers, timeout=timeout)
+    if max_content_size is None:
+        response = http_session.post(
+            target_url, data=message, headers=headers, timeout=timeout
+        )
+        content = response.text
+    else:
+        response = http_session.post(
+            target_url, data=message, headers=headers, timeout=timeout, stream=True
+        )
+        content = read_response_content(response, max_content_size)
     return WebhookResponse(
-        content=response.text,
+        content=content,
         request_headers=headers,
         response_headers=dict(response.headers),
         response_status_code=response.status_code,
@@ -216,23 +357,44 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+@lru_cache(maxsize=64)
+def get_sqs_client(region, access_key_id, secret_access_key):
+    """Return an SQS client, reusing the one created for the same credentials."""
+    return boto3.client(
+        "sqs",
+        region_name=region,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_pubsub_publisher():
+    """Return a shared Pub/Sub publisher client; the client is thread-safe."""
+    batch_settings = pubsub_v1.types.BatchSettings(
+        max_messages=PUBSUB_MAX_BATCH_MESSAGES,
+        max_bytes=PUBSUB_MAX_BATCH_SIZE,
+        max_latency=PUBSUB_MAX_BATCH_LATENCY,
+    )
+    return pubsub_v1.PublisherClient(batch_settings=batch_settings)
+
+
+def get_sqs_queue(target_url):
+    """Return the SQS client, queue URL and FIFO flag for the webhook target URL."""
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=parts.password,
-    )
+    client = get_sqs_client(region, parts.username, parts.password)
     queue_url = urlunparse(
         ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
     )
     is_fifo = parts.path.endswith(".fifo")
+    return client, queue_url, is_fifo
 
+
+def get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo):
     msg_attributes = {
         "SaleorDomain": {"DataType": "String", "StringValue": domain},
         "EventType": {"DataType": "String", "StringValue": event_type},
@@ -241,22 +403,102 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
         msg_attributes["Signature"] = {"DataType": "String", "StringValue": signature}
 
     message_kwargs = {
-        "QueueUrl": queue_url,
         "MessageAttributes": msg_attributes,
         "MessageBody": message.decode("utf-8"),
     }
     if is_fifo:
         message_kwargs["MessageGroupId"] = domain
+    return message_kwargs
+
+
+def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+    client, queue_url, is_fifo = get_sqs_queue(target_url)
+    message_kwargs = get_sqs_message_kwargs(
+        message, domain, signature, event_type, is_fifo
+    )
     with catch_duration_time() as duration:
-        response = client.send_message(**message_kwargs)
+        response = client.send_message(QueueUrl=queue_url, **message_kwargs)
         return WebhookResponse(content=response, duration=duration())
 
 
+def _get_sqs_entry_size(entry):
+    size = len(entry["MessageBody"].encode("utf-8"))
+    for name, attribute in entry["MessageAttributes"].items():
+        size += len(name) + len(attribute["DataType"])
+        size += len(attribute["StringValue"].encode("utf-8"))
+    return size
+
+
+def _chunk_sqs_entries(entries):
+    """Split entries into chunks accepted by a single `send_message_batch` call."""
+    chunk: List[Dict] = []
+    chunk_size = 0
+    for entry in entries:
+        entry_size = _get_sqs_entry_size(entry)
+        if chunk and (
+            len(chunk) == SQS_MAX_BATCH_ENTRIES
+            or chunk_size + entry_size > SQS_MAX_BATCH_SIZE
+        ):
+            yield chunk
+            chunk, chunk_size = [], 0
+        chunk.append(entry)
+        chunk_size += entry_size
+    if chunk:
+        yield chunk
+
+
+def send_webhooks_using_aws_sqs_batch(
+    target_url, messages, domain
+) -> Dict[str, WebhookResponse]:
+    """Send multiple messages to a single SQS queue using `send_message_batch`.
+
+    :param target_url: Target URL messages will be sent to.
+    :param messages: List of (id, message, signature, event_type) tuples.
+    :param domain: Current site domain.
+
+    :return: WebhookResponse objects keyed by message id.
+    """
+    client, queue_url, is_fifo = get_sqs_queue(target_url)
+    entries = [
+        {
+            "Id": message_id,
+            **get_sqs_message_kwargs(message, domain, signature, event_type, is_fifo),
+        }
+        for message_id, message, signature, event_type in messages
+    ]
+
+    responses = {}
+    for chunk in _chunk_sqs_entries(entries):
+        with catch_duration_time() as duration:
+            try:
+                response = client.send_message_batch(QueueUrl=queue_url, Entries=chunk)
+            except (ClientError, BotoCoreError) as e:
+                for entry in chunk:
+                    responses[entry["Id"]] = WebhookResponse(
+                        content=str(e),
+                        status=EventDeliveryStatus.FAILED,
+                        duration=duration(),
+                    )
+                continue
+            response_duration = duration()
+        for result in response.get("Successful", []):
+            responses[result["Id"]] = WebhookResponse(
+                content=result, duration=response_duration
+            )
+        for result in response.get("Failed", []):
+            responses[result["Id"]] = WebhookResponse(
+                content=result,
+                status=EventDeliveryStatus.FAILED,
+                duration=response_duration,
+            )
+    return responses
+
+
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_publisher()
     topic_name = parts.path[1:]  # drop the leading slash
     with catch_duration_time() as duration:
         future = client.publish(
@@ -271,24 +513,71 @@ def send_webhook_using_google_cloud_pubsub(
         return WebhookResponse(content=response, duration=response_duration)
 
 
+def send_webhooks_using_google_cloud_pubsub_batch(
+    target_url, messages, domain
+) -> Dict[str, WebhookResponse]:
+    """Publish multiple messages to a single Google Cloud Pub/Sub topic.
+
+    :param target_url: Target URL messages will be sent to.
+    :param messages: List of (id, message, signature, event_type) tuples.
+    :param domain: Current site domain.
+
+    :return: WebhookResponse objects keyed by message id.
+    """
+    parts = urlparse(target_url)
+    client = get_pubsub_publisher()
+    topic_name = parts.path[1:]  # drop the leading slash
+    responses = {}
+    futures = {}
+    with catch_duration_time() as duration:
+        for message_id, message, signature, event_type in messages:
+            try:
+                futures[message_id] = client.publish(
+                    topic_name,
+                    message,
+                    saleorDomain=domain,
+                    eventType=event_type,
+                    signature=signature,
+                )
+            except PUBSUB_EXCEPTIONS as e:
+                responses[message_id] = WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+        for message_id, future in futures.items():
+            try:
+                response = future.result(timeout=WEBHOOK_TIMEOUT)
+            except PUBSUB_EXCEPTIONS as e:
+                responses[message_id] = WebhookResponse(
+                    content=str(e),
+                    status=EventDeliveryStatus.FAILED,
+                    duration=duration(),
+                )
+            else:
+                responses[message_id] = WebhookResponse(
+                    content=response, duration=duration()
+                )
+    return responses
+
+
+# Send methods and the exceptions they raise for failed requests, by target URL scheme.
+WEBHOOK_SCHEME_METHODS: Dict[str, Tuple[Callable, Tuple[Type[Exception], ...]]] = {
+    WebhookSchemes.HTTP: (send_webhook_using_http, (RequestException,)),
+    WebhookSchemes.HTTPS: (send_webhook_using_http, (RequestException,)),
+    WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, (ClientError,)),
+    WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
+        send_webhook_using_google_cloud_pubsub,
+        (pubsub_v1.publisher.exceptions.MessageTooLargeError, RuntimeError),
+    ),
+}
+
+
 def send_webhook_using_scheme_method(
     target_url, domain, secret, event_type, data
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
-    scheme_matrix: Dict[
-        WebhookSchemes, Tuple[Callable, Tuple[Type[Exception], ...]]
-    ] = {
-        WebhookSchemes.HTTP: (send_webhook_using_http, (RequestException,)),
-        WebhookSchemes.HTTPS: (send_webhook_using_http, (RequestException,)),
-        WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, (ClientError,)),
-        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
-            send_webhook_using_google_cloud_pubsub,
-            (pubsub_v1.publisher.exceptions.MessageTooLargeError, RuntimeError),
-        ),
-    }
-    if method := scheme_matrix.get(parts.scheme.lower()):
+    if method := WEBHOOK_SCHEME_METHODS.get(parts.scheme.lower()):
         send_method, send_exception = method
         try:
             return send_method(
@@ -303,6 +592,20 @@ def send_webhook_using_scheme_method(
     raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
 
 
+def get_deliveries_for_sending():
+    """Return deliveries with only the related data needed to send them."""
+    return EventDelivery.objects.select_related("payload", "webhook__app").only(
+        "id",
+        "status",
+        "event_type",
+        "payload__payload",
+        "webhook__target_url",
+        "webhook__secret_key",
+        "webhook__is_active",
+        "webhook__app__name",
+    )
+
+
 @app.task(
     bind=True,
     retry_backoff=10,
@@ -310,9 +613,7 @@ def send_webhook_using_scheme_method(
 )
 def send_webhook_request_async(self, event_delivery_id):
     try:
-        delivery = EventDelivery.objects.select_related("payload", "webhook__app").get(
-            id=event_delivery_id
-        )
+        delivery = get_deliveries_for_sending().get(id=event_delivery_id)
     except EventDelivery.DoesNotExist:
         logger.error("Event delivery id: %r not found", event_delivery_id)
         return
@@ -325,8 +626,6 @@ def send_webhook_request_async(self, event_delivery_id):
     webhook = delivery.webhook
     data = delivery.payload.payload
     domain = Site.objects.get_current().domain
-    attempt = create_attempt(delivery, self.request.id)
-    delivery_status = EventDeliveryStatus.SUCCESS
     try:
         with webhooks_opentracing_trace(
             delivery.event_type, domain, app_name=webhook.app.name
@@ -338,7 +637,92 @@ def send_webhook_request_async(self, event_delivery_id):
                 delivery.event_type,
                 data,
             )
-        attempt_update(attempt, response)
+    except ValueError as e:
+        response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+        create_attempt(delivery, self.request.id, response)
+        delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
+        return
+
+    # the attempt is stored together with the response to avoid an extra UPDATE
+    attempt = create_attempt(delivery, self.request.id, response)
+    delivery_status = EventDeliveryStatus.SUCCESS
+    if response.status == EventDeliveryStatus.FAILED:
+        task_logger.info(
+            "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+            " Delivery attempt id: %r",
+            webhook.id,
+            webhook.target_url,
+            response.content,
+            delivery.event_type,
+            attempt.id,
+        )
+        try:
+            countdown = self.retry_backoff * (2**self.request.retries)
+            self.retry(countdown=countdown, **self.retry_kwargs)
+        except MaxRetriesExceededError:
+            task_logger.warning(
+                "[Webhook ID: %r] Failed request to %r: exceeded retry limit."
+                "Delivery id: %r",
+                webhook.id,
+                webhook.target_url,
+                delivery.id,
+            )
+            delivery_status = EventDeliveryStatus.FAILED
+    elif response.status == EventDeliveryStatus.SUCCESS:
+        task_logger.info(
+            "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+            webhook.id,
+            webhook.target_url,
+            delivery.event_type,
+            delivery.id,
+        )
+    delivery_update(delivery, delivery_status)
+    clear_successful_delivery(delivery)
+
+
+def _send_webhook_request_in_thread(
+    target_url, domain, secret, event_type, data, app_name
+) -> WebhookResponse:
+    with webhooks_opentracing_trace(event_type, domain, app_name=app_name):
+        return send_webhook_using_scheme_method(
+            target_url, domain, secret, event_type, data
+        )
+
+
+def _get_active_deliveries(delivery_ids) -> List[EventDelivery]:
+    deliveries = []
+    disabled_deliveries = []
+    for delivery in get_deliveries_for_sending().filter(id__in=delivery_ids):
+        if delivery.webhook.is_active:
+            deliveries.append(delivery)
+        else:
+            delivery.status = EventDeliveryStatus.FAILED
+            disabled_deliveries.append(delivery)
+            logger.info("Event delivery id: %r webhook is disabled.", delivery.id)
+    if disabled_deliveries:
+        EventDelivery.objects.bulk_update(disabled_deliveries, ["status"])
+    return deliveries
+
+
+def _save_batch_delivery_responses(task, delivery_responses):
+    """Store responses of deliveries sent within a batch task using bulk queries.
+
+    Failed deliveries are rescheduled as separate `send_webhook_request_async`
+    tasks and follow its retry policy, unless they can't be sent at all. The batch
+    attempt counts as the first try of the rescheduled task.
+
+    :param delivery_responses: List of (delivery, response, can_retry) tuples.
+    """
+    attempts = EventDeliveryAttempt.objects.bulk_create(
+        [
+            build_attempt(delivery, task.request.id, response)
+            for delivery, response, _ in delivery_responses
+        ]
+    )
+    failed_deliveries = []
+    successful_deliveries = []
+    for (delivery, response, can_retry), attempt in zip(delivery_responses, attempts):
+        webhook = delivery.webhook
         if response.status == EventDeliveryStatus.FAILED:
             task_logger.info(
                 "[Webhook ID: %r] Failed request to %r: %r for event: %r."
@@ -349,19 +733,16 @@ def send_webhook_request_async(self, event_delivery_id):
                 delivery.event_type,
                 attempt.id,
             )
-            try:
-                countdown = self.retry_backoff * (2**self.request.retries)
-                self.retry(countdown=countdown, **self.retry_kwargs)
-            except MaxRetriesExceededError:
-                task_logger.warning(
-                    "[Webhook ID: %r] Failed request to %r: exceeded retry limit."
-                    "Delivery id: %r",
-                    webhook.id,
-                    webhook.target_url,
-                    delivery.id,
+            if can_retry:
+                send_webhook_request_async.apply_async(
+                    (delivery.id,),
+                    countdown=send_webhook_request_async.retry_backoff,
+                    retries=1,
                 )
-                delivery_status = EventDeliveryStatus.FAILED
-        elif response.status == EventDeliveryStatus.SUCCESS:
+            else:
+                delivery.status = EventDeliveryStatus.FAILED
+                failed_deliveries.append(delivery)
+        else:
             task_logger.info(
                 "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
                 webhook.id,
@@ -369,12 +750,140 @@ def send_webhook_request_async(self, event_delivery_id):
                 delivery.event_type,
                 delivery.id,
             )
-        delivery_update(delivery, delivery_status)
-    except ValueError as e:
-        response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
-        attempt_update(attempt, response)
-        delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
-    clear_successful_delivery(delivery)
+            delivery.status = EventDeliveryStatus.SUCCESS
+            successful_deliveries.append(delivery)
+
+    if failed_deliveries:
+        EventDelivery.objects.bulk_update(failed_deliveries, ["status"])
+    clear_successful_deliveries(successful_deliveries)
+
+
+@app.task(bind=True)
+def send_webhook_batch_async(self, delivery_ids):
+    """Send multiple async webhook deliveries concurrently.
+
+    Requests are dispatched from a thread pool, so a single worker handles many
+    I/O bound deliveries at once.
+    """
+    deliveries = _get_active_deliveries(delivery_ids)
+    if not deliveries:
+        return
+
+    domain = Site.objects.get_current().domain
+    max_workers = min(len(deliveries), WEBHOOK_BATCH_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _send_webhook_request_in_thread,
+                delivery.webhook.target_url,
+                domain,
+                delivery.webhook.secret_key,
+                delivery.event_type,
+                delivery.payload.payload,
+                delivery.webhook.app.name,
+            )
+            for delivery in deliveries
+        ]
+
+    delivery_responses = []
+    for delivery, future in zip(deliveries, futures):
+        try:
+            delivery_responses.append((delivery, future.result(), True))
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            delivery_responses.append((delivery, response, False))
+        except Exception as e:
+            # a single delivery failing unexpectedly must not lose the others
+            task_logger.exception(
+                "[Webhook] Failed to send delivery id: %r.", delivery.id
+            )
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            delivery_responses.append((delivery, response, True))
+    _save_batch_delivery_responses(self, delivery_responses)
+
+
+def _send_webhook_batch_by_target_url(task, delivery_ids, batch_send_method):
+    """Send deliveries sharing the same target URL with a single batch method call.
+
+    Deliveries are also grouped by event type and app, so each batch call is
+    traced the same way as a single delivery.
+
+    The batch method is called with the target URL, the list of
+    (id, message, signature, event_type) tuples and the current site domain,
+    and returns WebhookResponse objects keyed by message id.
+    """
+    deliveries = _get_active_deliveries(delivery_ids)
+    if not deliveries:
+        return
+
+    domain = Site.objects.get_current().domain
+    delivery_responses = []
+    deliveries_by_batch = defaultdict(list)
+    for delivery in deliveries:
+        key = (
+            delivery.webhook.target_url,
+            delivery.event_type,
+            delivery.webhook.app.name,
+        )
+        deliveries_by_batch[key].append(delivery)
+
+    for key, target_deliveries in deliveries_by_batch.items():
+        target_url, event_type, app_name = key
+        messages = []
+        for delivery in target_deliveries:
+            message = delivery.payload.payload.encode("utf-8")
+            signature = signature_for_payload(message, delivery.webhook.secret_key)
+            messages.append((str(delivery.id), message, signature, delivery.event_type))
+
+        try:
+            with webhooks_opentracing_trace(event_type, domain, app_name=app_name):
+                responses = batch_send_method(target_url, messages, domain)
+        except Exception as e:
+            # a single target failing must not lose responses of the other ones
+            task_logger.exception("[Webhook] Failed batch request to %r.", target_url)
+            responses = {
+                message_id: WebhookResponse(
+                    content=str(e), status=EventDeliveryStatus.FAILED
+                )
+                for message_id, *_ in messages
+            }
+
+        for delivery in target_deliveries:
+            message_id = str(delivery.id)
+            response = responses.get(message_id) or WebhookResponse(
+                content="Missing response for the batch entry.",
+                status=EventDeliveryStatus.FAILED,
+            )
+            delivery_responses.append((delivery, response, True))
+    _save_batch_delivery_responses(task, delivery_responses)
+
+
+@app.task(bind=True)
+def send_webhook_sqs_batch_async(self, delivery_ids):
+    """Send async webhook deliveries targeting AWS SQS queues in batches.
+
+    Deliveries sharing the same target URL are sent with `send_message_batch`,
+    up to ten messages per request.
+    """
+    _send_webhook_batch_by_target_url(
+        self, delivery_ids, send_webhooks_using_aws_sqs_batch
+    )
+
+
+@app.task(bind=True)
+def send_webhook_pubsub_batch_async(self, delivery_ids):
+    """Send async webhook deliveries targeting Google Cloud Pub/Sub in batches.
+
+    All messages for the same topic are published before waiting for the results,
+    so the publisher can coalesce them into a single request.
+    """
+    _send_webhook_batch_by_target_url(
+        self, delivery_ids, send_webhooks_using_google_cloud_pubsub_batch
+    )
 
 
 def send_webhook_request_sync(
@@ -412,6 +921,7 @@ def send_webhook_request_sync(
                 signature,
                 delivery.event_type,
                 timeout=timeout,
+                max_content_size=None,
             )
             response_data = json.loads(response.content)
     except RequestException as e:
@@ -455,27 +965,31 @@ def send_webhook_request_sync(
 
 # DEPRECATED
 # to be removed in task: #1q2x7xw
-@app.task(compression="zlib")
+@app.task
 def trigger_webhooks_for_event(event_type, data):
-    """Send a webhook request for an event as an async task."""
-    webhooks = get_webhooks_for_event(event_type)
-    for webhook in webhooks:
-        send_webhook_request.delay(
-            webhook.app.name,
-            webhook.pk,
-            webhook.target_url,
-            webhook.secret_key,
-            event_type,
-            data,
-        )
+    """Send a webhook request for an event as an async task.
+
+    The given data is sent to all webhooks, including the subscription ones, as the
+    legacy task did.
+    """
+    webhooks = get_cached_webhooks_for_event(event_type)
+    if not webhooks:
+        return
+    payload = EventPayload.objects.create(payload=data)
+    deliveries = create_event_delivery_list_for_webhooks(
+        webhooks=webhooks,
+        event_payload=payload,
+        event_type=event_type,
+    )
+    group(get_delivery_task_signatures(deliveries)).apply_async()
 
 
+# Not scheduled anymore, kept to consume messages that are already queued.
 # to be removed in task: #1q2x7xw
 @app.task(
     bind=True,
     retry_backoff=10,
     retry_kwargs={"max_retries": 5},
-    compression="zlib",
 )
 def send_webhook_request(
     self, app_name, webhook_id, target_url, secret, event_type, data
@@ -485,17 +999,7 @@ def send_webhook_request(
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
 
-    scheme_matrix = {
-        WebhookSchemes.HTTP: (send_webhook_using_http, RequestException),
-        WebhookSchemes.HTTPS: (send_webhook_using_http, RequestException),
-        WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, ClientError),
-        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
-            send_webhook_using_google_cloud_pubsub,
-            pubsub_v1.publisher.exceptions.MessageTooLargeError,
-        ),
-    }
-
-    if methods := scheme_matrix.get(parts.scheme.lower()):
+    if methods := WEBHOOK_SCHEME_METHODS.get(parts.scheme.lower()):
         send_method, send_exception = methods
         try:
             with webhooks_opentracing_trace(event_type, domain, app_name=app_name):
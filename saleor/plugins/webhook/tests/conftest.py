@@ -7,13 +7,26 @@ from measurement.measures import Weight
 from prices import Money
 
 from ....app.models import App
+from ....graphql.webhook.subscription_payload import get_subscription_document
 from ....plugins.manager import get_plugins_manager
 from ....plugins.webhook.plugin import WebhookPlugin
+from ....plugins.webhook.tasks import get_pubsub_publisher, get_sqs_client
 from ....shipping.interface import ShippingMethodData
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
 
 
+@pytest.fixture(autouse=True)
+def clear_webhook_clients_cache():
+    get_sqs_client.cache_clear()
+    get_pubsub_publisher.cache_clear()
+    get_subscription_document.cache_clear()
+    yield
+    get_sqs_client.cache_clear()
+    get_pubsub_publisher.cache_clear()
+    get_subscription_document.cache_clear()
+
+
 @pytest.fixture
 def webhook_plugin(settings):
     def factory() -> WebhookPlugin:
@@ -8,7 +8,11 @@ from freezegun import freeze_time
 
 from .....channel.models import Channel
 from .....giftcard.models import GiftCard
-from .....graphql.webhook.subscription_payload import validate_subscription_query
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_from_subscription,
+    parse,
+    validate_subscription_query,
+)
 from .....menu.models import Menu, MenuItem
 from .....product.models import Category
 from .....shipping.models import ShippingMethod, ShippingZone
@@ -1265,6 +1269,50 @@ def test_create_deliveries_for_subscriptions_unsubscribable_event(
     assert len(deliveries) == 0
 
 
+@patch(
+    "saleor.plugins.webhook.tasks.generate_payload_from_subscription",
+    wraps=generate_payload_from_subscription,
+)
+def test_create_deliveries_for_subscriptions_reuses_payload_for_same_query(
+    mocked_generate_payload, app, subscription_webhook
+):
+    # given
+    event_type = WebhookEventAsyncType.APP_INSTALLED
+    webhooks = [
+        subscription_webhook(subscription_queries.APP_INSTALLED, event_type),
+        subscription_webhook(subscription_queries.APP_INSTALLED, event_type),
+    ]
+    app_id = graphene.Node.to_global_id("App", app.id)
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, app, webhooks)
+
+    # then
+    mocked_generate_payload.assert_called_once()
+    assert len(deliveries) == len(webhooks)
+    assert deliveries[0].payload_id == deliveries[1].payload_id
+    assert deliveries[0].payload.payload == generate_app_payload(app, app_id)
+    assert {delivery.webhook for delivery in deliveries} == set(webhooks)
+
+
+@patch("saleor.graphql.webhook.subscription_payload.parse", wraps=parse)
+def test_create_deliveries_for_subscriptions_parses_query_once(
+    mocked_parse, app, subscription_app_installed_webhook
+):
+    # given
+    event_type = WebhookEventAsyncType.APP_INSTALLED
+    webhooks = [subscription_app_installed_webhook]
+
+    # when
+    create_deliveries_for_subscriptions(event_type, app, webhooks)
+    deliveries = create_deliveries_for_subscriptions(event_type, app, webhooks)
+
+    # then
+    mocked_parse.assert_called_once_with(subscription_queries.APP_INSTALLED)
+    assert len(deliveries) == 1
+    assert deliveries[0].payload.payload
+
+
 @patch("saleor.graphql.webhook.subscription_payload.get_default_backend")
 @patch.object(logger, "warning")
 def test_create_deliveries_for_subscriptions_document_executed_with_error(
@@ -1,9 +1,11 @@
 import dataclasses
 from unittest import mock
 
+from .....core.models import EventDelivery
 from .....webhook.event_types import WebhookEventAsyncType
 from .....webhook.models import Webhook
 from ...tasks import trigger_webhooks_async
+from . import subscription_queries
 
 TEST_ID = "test_id"
 
@@ -13,11 +15,11 @@ class FakeDelivery:
     id = TEST_ID
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.group")
 @mock.patch("saleor.plugins.webhook.tasks.create_deliveries_for_subscriptions")
 def test_trigger_webhooks_async_no_subscription_webhooks(
     mocked_create_deliveries_for_subscriptions,
-    mocked_send_webhook_request,
+    mocked_group,
     webhook,
     order,
 ):
@@ -26,3 +28,58 @@ def test_trigger_webhooks_async_no_subscription_webhooks(
     data = {"regular_webhook": "data"}
     trigger_webhooks_async(data, webhook_type, webhooks, order)
     mocked_create_deliveries_for_subscriptions.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.group")
+@mock.patch("saleor.plugins.webhook.tasks.create_deliveries_for_subscriptions")
+def test_trigger_webhooks_async_regular_and_subscription_webhooks(
+    mocked_create_deliveries_for_subscriptions,
+    mocked_group,
+    webhook,
+    subscription_order_updated_webhook,
+    order,
+):
+    # given
+    mocked_create_deliveries_for_subscriptions.return_value = []
+    webhook_type = WebhookEventAsyncType.ORDER_UPDATED
+    data = '{"regular_webhook": "data"}'
+
+    # when
+    trigger_webhooks_async(
+        data, webhook_type, [webhook, subscription_order_updated_webhook], order
+    )
+
+    # then
+    mocked_create_deliveries_for_subscriptions.assert_called_once_with(
+        event_type=webhook_type,
+        subscribable_object=order,
+        webhooks=[subscription_order_updated_webhook],
+        requestor=None,
+    )
+    delivery = EventDelivery.objects.get()
+    assert delivery.webhook == webhook
+
+
+@mock.patch("saleor.plugins.webhook.tasks.group")
+@mock.patch("saleor.plugins.webhook.tasks.create_deliveries_for_subscriptions")
+def test_trigger_webhooks_async_not_subscribable_event(
+    mocked_create_deliveries_for_subscriptions,
+    mocked_group,
+    webhook,
+    subscription_webhook,
+):
+    # given
+    webhook_type = WebhookEventAsyncType.NOTIFY_USER
+    notify_webhook = subscription_webhook(
+        subscription_queries.ORDER_UPDATED, webhook_type
+    )
+    data = '{"notify_event": "data"}'
+
+    # when
+    trigger_webhooks_async(data, webhook_type, [webhook, notify_webhook])
+
+    # then
+    mocked_create_deliveries_for_subscriptions.assert_not_called()
+    deliveries = EventDelivery.objects.all()
+    assert {delivery.webhook for delivery in deliveries} == {webhook, notify_webhook}
+    assert {delivery.payload.payload for delivery in deliveries} == {data}
@@ -81,7 +81,7 @@ def test_trigger_webhook_sync_no_webhook_available():
         trigger_webhook_sync(WebhookEventSyncType.PAYMENT_REFUND, {}, app)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.http_session.post")
 def test_send_webhook_request_sync_failed_attempt(mock_post, app, event_delivery):
     # given
     expected_data = {
@@ -109,7 +109,7 @@ def test_send_webhook_request_sync_failed_attempt(mock_post, app, event_delivery
     assert response_data is None
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.http_session.post")
 @mock.patch("saleor.plugins.webhook.tasks.clear_successful_delivery")
 def test_send_webhook_request_sync_successful_attempt(
     mock_clear_delivery, mock_post, app, event_delivery
@@ -142,7 +142,9 @@ def test_send_webhook_request_sync_successful_attempt(
     assert response_data == json.loads(expected_data["content"])
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post", side_effect=RequestException)
+@mock.patch(
+    "saleor.plugins.webhook.tasks.http_session.post", side_effect=RequestException
+)
 def test_send_webhook_request_sync_request_exception(mock_post, app, event_delivery):
     # when
     response_data = send_webhook_request_sync(app.name, event_delivery)
@@ -159,7 +161,7 @@ def test_send_webhook_request_sync_request_exception(mock_post, app, event_deliv
     assert response_data is None
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.http_session.post")
 def test_send_webhook_request_sync_when_exception_with_response(
     mock_post, app, event_delivery
 ):
@@ -178,7 +180,7 @@ def test_send_webhook_request_sync_when_exception_with_response(
     assert attempt.response_status_code == 302
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.http_session.post")
 def test_send_webhook_request_sync_json_parsing_error(mock_post, app, event_delivery):
     # given
     expected_data = {
@@ -206,7 +208,7 @@ def test_send_webhook_request_sync_json_parsing_error(mock_post, app, event_deli
     assert response_data is None
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.http_session.post")
 def test_send_webhook_request_with_proper_timeout(mock_post, event_delivery, app):
     mock_post().text = '{"key": "response_text"}'
     mock_post().headers = {"header_key": "header_val"}
@@ -4,9 +4,7 @@ import logging
 from contextlib import contextmanager
 from dataclasses import dataclass
 from time import time
-from typing import TYPE_CHECKING, Any, List, Optional
-
-from django.db.models import QuerySet
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
 
 from ...core.models import (
     EventDelivery,
@@ -15,10 +13,12 @@ from ...core.models import (
     EventPayload,
 )
 from ...payment.interface import GatewayResponse, PaymentGateway, PaymentMethodInfo
+from ...settings import WEBHOOK_BULK_CREATE_BATCH_SIZE
 
 if TYPE_CHECKING:
     from ...app.models import App
     from ...payment.interface import PaymentData
+    from ...webhook.models import Webhook
     from .tasks import WebhookResponse
 
 
@@ -133,7 +133,7 @@ def catch_duration_time():
 
 
 def create_event_delivery_list_for_webhooks(
-    webhooks: QuerySet,
+    webhooks: Iterable["Webhook"],
     event_payload: "EventPayload",
     event_type: str,
 ) -> List[EventDelivery]:
@@ -146,15 +146,54 @@ def create_event_delivery_list_for_webhooks(
                 webhook=webhook,
             )
             for webhook in webhooks
-        ]
+        ],
+        batch_size=WEBHOOK_BULK_CREATE_BATCH_SIZE,
     )
     return event_deliveries
 
 
+ATTEMPT_RESPONSE_FIELDS = [
+    "duration",
+    "response",
+    "response_headers",
+    "response_status_code",
+    "request_headers",
+    "status",
+]
+
+
+def _set_attempt_response(
+    attempt: "EventDeliveryAttempt",
+    webhook_response: "WebhookResponse",
+):
+    attempt.duration = webhook_response.duration
+    attempt.response = webhook_response.content
+    attempt.response_headers = json.dumps(webhook_response.response_headers)
+    attempt.response_status_code = webhook_response.response_status_code
+    attempt.request_headers = json.dumps(webhook_response.request_headers)
+    attempt.status = webhook_response.status
+
+
+def build_attempt(
+    delivery: "EventDelivery",
+    task_id: Optional[str],
+    webhook_response: "WebhookResponse",
+) -> EventDeliveryAttempt:
+    """Return a not saved attempt storing the webhook response."""
+    attempt = EventDeliveryAttempt(delivery=delivery, task_id=task_id)
+    _set_attempt_response(attempt, webhook_response)
+    return attempt
+
+
 def create_attempt(
     delivery: "EventDelivery",
     task_id: str = None,
+    webhook_response: Optional["WebhookResponse"] = None,
 ):
+    if webhook_response:
+        attempt = build_attempt(delivery, task_id, webhook_response)
+        attempt.save()
+        return attempt
     attempt = EventDeliveryAttempt.objects.create(
         delivery=delivery,
         task_id=task_id,
@@ -171,23 +210,8 @@ def attempt_update(
     attempt: "EventDeliveryAttempt",
     webhook_response: "WebhookResponse",
 ):
-
-    attempt.duration = webhook_response.duration
-    attempt.response = webhook_response.content
-    attempt.response_headers = json.dumps(webhook_response.response_headers)
-    attempt.response_status_code = webhook_response.response_status_code
-    attempt.request_headers = json.dumps(webhook_response.request_headers)
-    attempt.status = webhook_response.status
-    attempt.save(
-        update_fields=[
-            "duration",
-            "response",
-            "response_headers",
-            "response_status_code",
-            "request_headers",
-            "status",
-        ]
-    )
+    _set_attempt_response(attempt, webhook_response)
+    attempt.save(update_fields=ATTEMPT_RESPONSE_FIELDS)
 
 
 def delivery_update(delivery: "EventDelivery", status: str):
@@ -201,3 +225,19 @@ def clear_successful_delivery(delivery: "EventDelivery"):
         delivery.delete()
         if payload_id:
             EventPayload.objects.filter(pk=payload_id, deliveries__isnull=True).delete()
+
+
+def clear_successful_deliveries(deliveries: Iterable["EventDelivery"]):
+    delivery_ids = []
+    payload_ids = set()
+    for delivery in deliveries:
+        if delivery.status == EventDeliveryStatus.SUCCESS:
+            delivery_ids.append(delivery.pk)
+            if delivery.payload_id:
+                payload_ids.add(delivery.payload_id)
+    if delivery_ids:
+        EventDelivery.objects.filter(pk__in=delivery_ids).delete()
+    if payload_ids:
+        EventPayload.objects.filter(
+            pk__in=payload_ids, deliveries__isnull=True
+        ).delete()
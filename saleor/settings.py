@@ -644,6 +644,18 @@ if (
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
 
+# Maximum number of rows inserted in a single query when creating webhook payloads
+# and deliveries in bulk.
+WEBHOOK_BULK_CREATE_BATCH_SIZE = int(
+    os.environ.get("WEBHOOK_BULK_CREATE_BATCH_SIZE", 500)
+)
+
+# Maximum number of async webhook deliveries sent by a single batch task.
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 50))
+
+# Maximum number of webhook requests sent concurrently by a single batch task.
+WEBHOOK_BATCH_MAX_WORKERS = int(os.environ.get("WEBHOOK_BATCH_MAX_WORKERS", 16))
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
@@ -0,0 +1,30 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .signals import invalidate_webhooks_cache
+
+        # webhooks for event depend on webhooks, their events and apps permissions
+        for model in (App, Webhook, WebhookEvent):
+            model_name = model.__name__.lower()
+            post_save.connect(
+                invalidate_webhooks_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_cache_on_{model_name}_save",
+            )
+            post_delete.connect(
+                invalidate_webhooks_cache,
+                sender=model,
+                dispatch_uid=f"invalidate_webhooks_cache_on_{model_name}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhooks_cache,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhooks_cache_on_app_permissions_change",
+        )
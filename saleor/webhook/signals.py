@@ -0,0 +1,5 @@
+from .utils import invalidate_webhooks_for_event_cache
+
+
+def invalidate_webhooks_cache(sender, **kwargs):
+    invalidate_webhooks_for_event_cache()
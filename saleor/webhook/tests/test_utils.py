@@ -3,7 +3,7 @@ import pytest
 from ...app.models import App
 from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..models import Webhook
-from ..utils import get_webhooks_for_event
+from ..utils import get_cached_webhooks_for_event, get_webhooks_for_event
 
 
 @pytest.fixture
@@ -106,3 +106,47 @@ def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
     webhooks = get_webhooks_for_event(sync_type)
 
     assert set(webhooks) == {sync_webhook}
+
+
+def test_get_cached_webhooks_for_event(
+    sync_webhook, sync_type, django_assert_num_queries
+):
+    # given
+    app = sync_webhook.app
+    assert get_cached_webhooks_for_event(sync_type, app) == [sync_webhook]
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = get_cached_webhooks_for_event(sync_type, app)
+
+    # then
+    assert webhooks == [sync_webhook]
+
+
+def test_get_cached_webhooks_for_event_invalidated_on_webhook_change(
+    sync_webhook, sync_type
+):
+    # given
+    app = sync_webhook.app
+    assert get_cached_webhooks_for_event(sync_type, app) == [sync_webhook]
+
+    # when
+    sync_webhook.is_active = False
+    sync_webhook.save(update_fields=["is_active"])
+
+    # then
+    assert get_cached_webhooks_for_event(sync_type, app) == []
+
+
+def test_get_cached_webhooks_for_event_invalidated_on_app_permissions_change(
+    sync_webhook, sync_type
+):
+    # given
+    app = sync_webhook.app
+    assert get_cached_webhooks_for_event(sync_type, app) == [sync_webhook]
+
+    # when
+    app.permissions.clear()
+
+    # then
+    assert get_cached_webhooks_for_event(sync_type, app) == []
@@ -1,5 +1,8 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
+from uuid import uuid4
 
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 
@@ -11,6 +14,11 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
 
+WEBHOOKS_FOR_EVENT_CACHE_KEY = "webhooks_for_event"
+WEBHOOKS_FOR_EVENT_CACHE_VERSION_KEY = "webhooks_for_event_version"
+WEBHOOKS_FOR_EVENT_CACHE_TIMEOUT = 60
+
+
 def get_webhooks_for_event(
     event_type: str, webhooks: Optional["QuerySet[Webhook]"] = None
 ) -> "QuerySet[Webhook]":
@@ -39,3 +47,43 @@ def get_webhooks_for_event(
         .select_related("app")
         .prefetch_related("app__permissions__content_type")
     )
+
+
+def get_webhooks_for_event_cache_version() -> str:
+    version = cache.get(WEBHOOKS_FOR_EVENT_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(WEBHOOKS_FOR_EVENT_CACHE_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(WEBHOOKS_FOR_EVENT_CACHE_VERSION_KEY)
+    return version
+
+
+def invalidate_webhooks_for_event_cache():
+    """Make all cached results of `get_cached_webhooks_for_event` obsolete.
+
+    The version is changed right away and once again after the current transaction
+    is committed, so results cached from not yet committed data are not reused.
+    """
+
+    def set_new_version():
+        cache.set(WEBHOOKS_FOR_EVENT_CACHE_VERSION_KEY, uuid4().hex, timeout=None)
+
+    set_new_version()
+    transaction.on_commit(set_new_version)
+
+
+def get_cached_webhooks_for_event(
+    event_type: str, app: Optional[App] = None
+) -> List[Webhook]:
+    """Get active webhooks for an event, optionally limited to the app's webhooks.
+
+    The result is cached until any webhook, webhook event or app is changed.
+    """
+    version = get_webhooks_for_event_cache_version()
+    app_id = app.pk if app else None
+    cache_key = f"{WEBHOOKS_FOR_EVENT_CACHE_KEY}:{version}:{event_type}:{app_id}"
+    webhooks = app.webhooks.all() if app else None
+    return cache.get_or_set(
+        cache_key,
+        lambda: list(get_webhooks_for_event(event_type, webhooks)),
+        WEBHOOKS_FOR_EVENT_CACHE_TIMEOUT,
+    )